@@ -11,10 +11,24 @@ This is a headless server with no UI, designed to be used with Claude Desktop.
 
 import os
 import sys
+import csv
 import json
+import queue
+import atexit
+import asyncio
+import time
+import shutil
 import logging
+import tempfile
+import functools
+import threading
+import subprocess
+import zipfile
+from io import BytesIO, StringIO
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional
+from xml.sax.saxutils import escape
 
 from mcp.server.fastmcp import FastMCP
 
@@ -23,17 +37,29 @@ try:
     import docx
     from docx import Document
     from docx.shared import Pt, Inches
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls, qn
+    from docx.table import Table as DocxTable
+    from docx.text.paragraph import Paragraph as DocxParagraph
+    from docx.text.run import Run as DocxRun
 except ImportError:
     raise ImportError("Please install python-docx with: uv pip install python-docx")
 
 try:
     import pandas as pd
     import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.cell.cell import KNOWN_TYPES
+    from openpyxl.styles import Alignment, Border, Font, Side
+    from openpyxl.writer.excel import ExcelWriter
 except ImportError:
     raise ImportError("Please install pandas and openpyxl with: uv pip install pandas openpyxl")
 
 try:
+    from reportlab import platypus
+    from reportlab.lib import colors
     from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet
     from reportlab.pdfgen import canvas
 except ImportError:
     raise ImportError("Please install reportlab with: uv pip install reportlab")
@@ -43,6 +69,20 @@ try:
 except ImportError:
     raise ImportError("Please install docx2pdf with: uv pip install docx2pdf")
 
+# On Windows docx2pdf drives Word over COM, through pywin32 (one of its
+# dependencies there)
+if sys.platform == "win32":
+    import pythoncom
+
+# Optional: LibreOffice's UNO bridge, only importable from a Python that ships
+# with (or is configured for) LibreOffice
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+    from com.sun.star.connection import NoConnectException
+except ImportError:
+    uno = None
+
 # Set up logging
 log_dir = Path(__file__).parent.parent / "logs"
 log_dir.mkdir(exist_ok=True)
@@ -75,52 +115,199 @@ server = FastMCP(
 # Also expose as mcp for current code compatibility
 mcp = server
 
+@functools.lru_cache(maxsize=1024)
+def _make_dir(directory: str) -> None:
+    """Create directory if needed; bounded memo of directories created or confirmed this session."""
+    os.makedirs(directory, exist_ok=True)
+
+def _ensure_dir(filepath: str) -> None:
+    """Make sure the parent directory of filepath exists, skipping directories seen before."""
+    _make_dir(os.path.dirname(os.path.abspath(filepath)))
+
+def _retry_in_missing_dir(filepath: str, write: Callable[[], Any]) -> Any:
+    """
+    Call write, and if filepath's directory has gone, recreate it and call write once more.
+    
+    _make_dir skips directories it has seen before, so one deleted after its
+    first use would otherwise make every later write into it fail.
+    """
+    try:
+        return write()
+    except FileNotFoundError:
+        directory = os.path.dirname(os.path.abspath(filepath))
+        if os.path.isdir(directory):
+            raise
+        os.makedirs(directory, exist_ok=True)
+        return write()
+
+class ToolError(Exception):
+    """An expected tool failure, such as a missing source file, reported to the caller as-is."""
+
+def _tool_result(action: str):
+    """
+    Turn a tool body that returns its success payload into a full operation result.
+    
+    The payload is returned with "success": True unless it sets its own value.
+    A ToolError becomes a failure carrying its message; any other exception is
+    logged and reported as "Error <action>: <exception>".
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return {"success": True, **fn(*args, **kwargs)}
+            except ToolError as e:
+                return {"success": False, "message": str(e), "filepath": None}
+            except Exception as e:
+                logger.error("Error %s: %s", action, e)
+                return {"success": False, "message": f"Error {action}: {str(e)}", "filepath": None}
+        return wrapper
+    return decorator
+
+def _in_thread(fn):
+    """
+    Turn a blocking tool function into an async one that runs in a worker thread.
+    
+    Long conversions then no longer stall the server's event loop, so other
+    tool calls keep being served while they run.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    return wrapper
+
+# ---- Background Writes ----
+
+# Documents are serialized in memory on the request path and written to disk
+# by a single writer thread, so saves to the same path land in request order
+_write_queue: "queue.Queue[tuple[str, bytes]]" = queue.Queue()
+_pending_writes: Dict[str, int] = {}
+_write_errors: Dict[str, str] = {}
+_writes_changed = threading.Condition()
+
+def _writer_loop() -> None:
+    """Write queued documents to disk, recording failures for flush_pending_writes."""
+    while True:
+        path, data = _write_queue.get()
+        error = None
+        try:
+            _retry_in_missing_dir(path, lambda: Path(path).write_bytes(data))
+        except Exception as e:
+            error = str(e)
+            logger.error("Error writing queued file %s: %s", path, error)
+        
+        with _writes_changed:
+            if error is None:
+                _write_errors.pop(path, None)
+            else:
+                _write_errors[path] = error
+            
+            _pending_writes[path] -= 1
+            if not _pending_writes[path]:
+                del _pending_writes[path]
+            _writes_changed.notify_all()
+
+def _queue_save(document: Any, filepath: str) -> None:
+    """Serialize a python-docx Document or openpyxl Workbook and queue it for writing."""
+    buffer = BytesIO()
+    document.save(buffer)
+    
+    path = os.path.abspath(filepath)
+    with _writes_changed:
+        _pending_writes[path] = _pending_writes.get(path, 0) + 1
+    _write_queue.put((path, buffer.getvalue()))
+
+def _wait_for_writes(filepath: Optional[str] = None) -> None:
+    """Block until queued writes for filepath (or for every path) have reached the disk."""
+    with _writes_changed:
+        if filepath is None:
+            _writes_changed.wait_for(lambda: not _pending_writes)
+        else:
+            path = os.path.abspath(filepath)
+            _writes_changed.wait_for(lambda: path not in _pending_writes)
+
+threading.Thread(target=_writer_loop, name="document-writer", daemon=True).start()
+atexit.register(_wait_for_writes)
+
 # ---- Microsoft Word Operations ----
 
+def _load_document_template() -> bytes:
+    """Serialize python-docx's default template once so it can be reopened from memory."""
+    buffer = BytesIO()
+    Document().save(buffer)
+    return buffer.getvalue()
+
+_DOCUMENT_TEMPLATE = _load_document_template()
+
+def _new_document() -> docx.document.Document:
+    """Create a blank Word document from the cached default template."""
+    return Document(BytesIO(_DOCUMENT_TEMPLATE))
+
+def _paragraph_xml(text: str) -> str:
+    """Build the w:p markup python-docx's add_paragraph would produce for plain text."""
+    runs = '<w:tab/>'.join(
+        f'<w:t xml:space="preserve">{escape(chunk)}</w:t>' if chunk else ''
+        for chunk in text.split('\t')
+    )
+    return f'<w:p><w:r>{runs}</w:r></w:p>'
+
+def _append_paragraphs_xml(doc: docx.document.Document, paragraphs_xml: List[str]) -> None:
+    """Parse prebuilt w:p markup in one pass and append it to the document body."""
+    fragment = parse_xml(f'<w:body {nsdecls("w")}>{"".join(paragraphs_xml)}</w:body>')
+    body = doc.element.body
+    sect_pr = body.sectPr
+    
+    # Paragraphs must stay ahead of the trailing section properties
+    for p in list(fragment):
+        if sect_pr is not None:
+            sect_pr.addprevious(p)
+        else:
+            body.append(p)
+
 @server.tool()
+@_tool_result("creating Word document")
 def create_word_document(filepath: str, content: str) -> Dict[str, Any]:
     """
     Create a new Microsoft Word document with the provided content.
     
+    The file is written to disk in the background after this returns; call
+    flush_pending_writes to wait for it and to see any error from the write.
+    
     Args:
         filepath: Path where to save the document
         content: Text content for the document
         
     Returns:
-        Operation result with success status, message, and filepath
+        Operation result with success status, message, filepath, and queued=True
     """
-    try:
-        # Create a new document
-        doc = Document()
-        
-        # Add content
-        doc.add_paragraph(content)
-        
-        # Ensure the directory exists
-        os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
-        
-        # Save the document
-        doc.save(filepath)
-        
-        logger.info(f"Created Word document: {filepath}")
-        return {
-            "success": True,
-            "message": "Successfully created Word document",
-            "filepath": filepath
-        }
-    except Exception as e:
-        logger.error(f"Error creating Word document: {str(e)}")
-        return {
-            "success": False,
-            "message": f"Error creating Word document: {str(e)}",
-            "filepath": None
-        }
+    # Create a new document
+    doc = _new_document()
+    
+    # Add content
+    doc.add_paragraph(content)
+    
+    # Ensure the directory exists
+    _ensure_dir(filepath)
+    
+    # Save the document
+    _queue_save(doc, filepath)
+    
+    logger.info("Created Word document: %s", filepath)
+    return {
+        "message": "Created Word document; writing it to disk",
+        "queued": True,
+        "filepath": filepath
+    }
 
 @server.tool()
+@_tool_result("editing Word document")
 def edit_word_document(filepath: str, operations: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Edit an existing Microsoft Word document using the specified operations.
     
+    The file is written to disk in the background after this returns; call
+    flush_pending_writes to wait for it and to see any error from the write.
+    
     Args:
         filepath: Path to the Word document
         operations: List of operations to perform, where each operation is a dictionary with:
@@ -128,171 +315,310 @@ def edit_word_document(filepath: str, operations: List[Dict[str, Any]]) -> Dict[
             - Additional parameters depending on the operation type
             
     Returns:
-        Operation result with success status, message, and filepath
+        Operation result with success status, message, filepath, and queued=True
     """
-    try:
-        # Load the document
-        if not os.path.exists(filepath):
-            return {
-                "success": False,
-                "message": f"File not found: {filepath}",
-                "filepath": None
-            }
+    # Let any queued save of this file finish first
+    _wait_for_writes(filepath)
+    
+    # Load the document
+    if not os.path.exists(filepath):
+        raise ToolError(f"File not found: {filepath}")
+    
+    doc = Document(filepath)
+    
+    # doc.paragraphs rescans the whole body on every access, so build the
+    # list once and keep it in sync with the operations below
+    paragraphs = list(doc.paragraphs)
+    
+    # Apply operations
+    for op in operations:
+        op_type = op.get("type")
         
-        doc = Document(filepath)
+        if op_type == "add_paragraph":
+            paragraphs.append(doc.add_paragraph(op.get("text", "")))
         
-        # Apply operations
-        for op in operations:
-            op_type = op.get("type")
-            
-            if op_type == "add_paragraph":
-                doc.add_paragraph(op.get("text", ""))
-            
-            elif op_type == "add_heading":
-                doc.add_heading(op.get("text", ""), level=op.get("level", 1))
-            
-            elif op_type == "edit_paragraph":
-                idx = op.get("index", 0)
-                new_text = op.get("text", "")
-                
-                if 0 <= idx < len(doc.paragraphs):
-                    doc.paragraphs[idx].text = new_text
-                else:
-                    logger.warning(f"Paragraph index out of range: {idx}")
-            
-            elif op_type == "delete_paragraph":
-                idx = op.get("index", 0)
-                
-                if 0 <= idx < len(doc.paragraphs):
-                    p = doc.paragraphs[idx]
-                    p_elem = p._element
-                    p_elem.getparent().remove(p_elem)
-                else:
-                    logger.warning(f"Paragraph index out of range: {idx}")
+        elif op_type == "add_heading":
+            paragraphs.append(doc.add_heading(op.get("text", ""), level=op.get("level", 1)))
+        
+        elif op_type == "edit_paragraph":
+            idx = op.get("index", 0)
+            new_text = op.get("text", "")
             
+            if 0 <= idx < len(paragraphs):
+                paragraphs[idx].text = new_text
             else:
-                logger.warning(f"Unknown operation type: {op_type}")
+                logger.warning("Paragraph index out of range: %s", idx)
         
-        # Save the document
-        doc.save(filepath)
+        elif op_type == "delete_paragraph":
+            idx = op.get("index", 0)
+            
+            if 0 <= idx < len(paragraphs):
+                p_elem = paragraphs.pop(idx)._element
+                p_elem.getparent().remove(p_elem)
+            else:
+                logger.warning("Paragraph index out of range: %s", idx)
         
-        logger.info(f"Edited Word document: {filepath}")
-        return {
-            "success": True,
-            "message": "Successfully edited Word document",
-            "filepath": filepath
-        }
-    except Exception as e:
-        logger.error(f"Error editing Word document: {str(e)}")
-        return {
-            "success": False,
-            "message": f"Error editing Word document: {str(e)}",
-            "filepath": None
-        }
+        else:
+            logger.warning("Unknown operation type: %s", op_type)
+    
+    # Save the document
+    _queue_save(doc, filepath)
+    
+    logger.info("Edited Word document: %s", filepath)
+    return {
+        "message": "Edited Word document; writing it to disk",
+        "queued": True,
+        "filepath": filepath
+    }
 
 @server.tool()
+@_tool_result("converting text to Word")
 def convert_txt_to_word(source_path: str, target_path: str) -> Dict[str, Any]:
     """
     Convert a text file to a Microsoft Word document.
     
+    The file is written to disk in the background after this returns; call
+    flush_pending_writes to wait for it and to see any error from the write.
+    
     Args:
         source_path: Path to the text file
         target_path: Path where to save the Word document
         
     Returns:
-        Operation result with success status, message, and filepath
+        Operation result with success status, message, filepath, and queued=True
     """
-    try:
-        # Check if source file exists
-        if not os.path.exists(source_path):
-            return {
-                "success": False,
-                "message": f"Source file not found: {source_path}",
-                "filepath": None
-            }
-        
-        # Read the text file
-        with open(source_path, 'r', encoding='utf-8') as file:
-            text_content = file.read()
-        
-        # Create a new document
-        doc = Document()
+    # Check if source file exists
+    if not os.path.exists(source_path):
+        raise ToolError(f"Source file not found: {source_path}")
+    
+    # Read the text file line by line so the full text and its split copy
+    # are never held in memory at the same time
+    with open(source_path, 'r', encoding='utf-8', buffering=1024 * 1024) as file:
+        paragraphs_xml = [
+            _paragraph_xml(line.rstrip('\n'))
+            for line in file
+            if line.strip()  # Skip empty paragraphs
+        ]
+    
+    # Create a new document
+    doc = _new_document()
+    
+    # Add content as paragraphs, parsed as a single fragment
+    _append_paragraphs_xml(doc, paragraphs_xml)
+    
+    # Ensure the directory exists
+    _ensure_dir(target_path)
+    
+    # Save the document
+    _queue_save(doc, target_path)
+    
+    logger.info("Converted text to Word: %s -> %s", source_path, target_path)
+    return {
+        "message": "Converted text to Word document; writing it to disk",
+        "queued": True,
+        "filepath": target_path
+    }
+
+# ---- Excel Operations ----
+
+# Rows read from CSV sources per pandas chunk
+_CSV_CHUNK_ROWS = 50_000
+
+def _advise_sequential(file: Any) -> None:
+    """
+    Hint the kernel that an open file will be read front to back.
+    
+    Readahead then fetches larger contiguous blocks, which speeds up cold-cache
+    reads of big files. The hint applies to this open file (including an mmap
+    of it), so it must be given on the handle that is actually read.
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # Purely advisory; some filesystems reject it
+
+def _merge_dtypes(first: Any, second: Any) -> Any:
+    """Return the dtype pandas would give a column read whole, from the dtypes of two of its chunks."""
+    if first == second:
+        return first
+    if (
+        pd.api.types.is_numeric_dtype(first) and pd.api.types.is_numeric_dtype(second)
+        and not pd.api.types.is_bool_dtype(first) and not pd.api.types.is_bool_dtype(second)
+    ):
+        return "float64"
+    return object
+
+def _read_csv_chunks(
+    file: Any,
+    dtypes: Optional[Dict[str, str]] = None,
+    parse_dates: Optional[List[str]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Read an open CSV file in chunks whose column types hold for the whole file.
+    
+    pandas infers types separately for each chunk, so a column of "00123"
+    values with one "ABC" late in the file would be numbers in some chunks and
+    text in others. When the file spans more than one chunk, a first pass
+    infers each column's type across all chunks and a second pass reads the
+    rows with those types fixed. Columns named in dtypes or parse_dates keep
+    the caller's handling, and when that covers every column the file is read
+    only once.
+    """
+    options = {
+        "chunksize": _CSV_CHUNK_ROWS,
+        "parse_dates": parse_dates,
+        "engine": "c",
+        "low_memory": False,
+        "memory_map": True,
+    }
+    
+    with pd.read_csv(file, dtype=dtypes, **options) as reader:
+        first = next(reader)
+        second = next(reader, None)
+        if second is None:
+            # The whole file fit in one chunk, so its types already hold
+            yield first
+            return
         
-        # Add content as paragraphs (split by newlines)
-        for paragraph in text_content.split('\n'):
-            if paragraph.strip():  # Skip empty paragraphs
-                doc.add_paragraph(paragraph)
+        if set(first.columns) <= set(dtypes or {}) | set(parse_dates or []):
+            # Every column's handling is fixed by the caller; no inference to align
+            yield from chain([first, second], reader)
+            return
         
-        # Ensure the directory exists
-        os.makedirs(os.path.dirname(os.path.abspath(target_path)), exist_ok=True)
+        column_dtypes = dict(first.dtypes.items())
+        for chunk in chain([second], reader):
+            for column, dtype in chunk.dtypes.items():
+                column_dtypes[column] = _merge_dtypes(column_dtypes[column], dtype)
+    
+    # Dates are left to parse_dates, which must not be given a dtype as well
+    for column in parse_dates or []:
+        column_dtypes.pop(column, None)
+    column_dtypes.update(dtypes or {})
+    
+    file.seek(0)
+    with pd.read_csv(file, dtype=column_dtypes, **options) as reader:
+        yield from reader
+
+def _excel_value(value: Any) -> Any:
+    """Return value if openpyxl can store it in a cell, else its str(), as DataFrame.to_excel does."""
+    return value if isinstance(value, KNOWN_TYPES) else str(value)
+
+# Header cell style written by DataFrame.to_excel
+_HEADER_FONT = Font(bold=True)
+_HEADER_BORDER = Border(*(Side(style="thin") for _ in range(4)))
+_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="top")
+
+def _header_row(ws: Any, values: Iterable[Any]) -> List[WriteOnlyCell]:
+    """Build a styled header row for a write-only worksheet."""
+    cells = []
+    for value in values:
+        cell = WriteOnlyCell(ws, _excel_value(value))
+        cell.font = _HEADER_FONT
+        cell.border = _HEADER_BORDER
+        cell.alignment = _HEADER_ALIGNMENT
+        cells.append(cell)
+    return cells
+
+def _dataframes_to_workbook(frames: Iterable[pd.DataFrame]) -> openpyxl.Workbook:
+    """
+    Stream one or more DataFrames into a single sheet of a write-only workbook.
+    
+    The header row is taken from the first frame and styled bold, centred and
+    bordered. Rows are written straight to the worksheet XML instead of being
+    held as cell objects, so memory stays flat however many rows the frames
+    hold; missing values become empty cells and values such as lists or dicts
+    are written as text, as with DataFrame.to_excel.
+    """
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    
+    for i, df in enumerate(frames):
+        if i == 0:
+            ws.append(_header_row(ws, df.columns))
         
-        # Save the document
-        doc.save(target_path)
+        values = df.astype(object).where(df.notna(), None)
+        # Only object columns can hold values openpyxl rejects
+        for col, dtype in enumerate(df.dtypes):
+            if dtype == object:
+                values.isetitem(col, values.iloc[:, col].map(_excel_value))
         
-        logger.info(f"Converted text to Word: {source_path} -> {target_path}")
-        return {
-            "success": True,
-            "message": "Successfully converted text to Word document",
-            "filepath": target_path
-        }
-    except Exception as e:
-        logger.error(f"Error converting text to Word: {str(e)}")
-        return {
-            "success": False,
-            "message": f"Error converting text to Word: {str(e)}",
-            "filepath": None
-        }
+        for row in values.itertuples(index=False, name=None):
+            ws.append(row)
+    
+    return wb
 
-# ---- Excel Operations ----
+def _save_workbook(wb: openpyxl.Workbook, filepath: str, compresslevel: int = 1) -> None:
+    """
+    Save a workbook like Workbook.save, but at the given zip compression level.
+    
+    openpyxl always deflates at zlib's default level 6, and on large sheets that
+    compression is a large part of the save time; level 1 is much cheaper for
+    a somewhat larger file.
+    """
+    if wb.write_only and not wb.worksheets:
+        wb.create_sheet()
+    
+    archive = _retry_in_missing_dir(filepath, lambda: zipfile.ZipFile(
+        filepath, "w", zipfile.ZIP_DEFLATED, allowZip64=True, compresslevel=compresslevel
+    ))
+    ExcelWriter(wb, archive).save()  # Closes the archive
 
 @server.tool()
+@_tool_result("creating Excel file")
 def create_excel_file(filepath: str, content: str) -> Dict[str, Any]:
     """
     Create a new Excel file with the provided content.
     
+    The file is written to disk in the background after this returns; call
+    flush_pending_writes to wait for it and to see any error from the write.
+    
     Args:
         filepath: Path where to save the Excel file
         content: Data content, either JSON string or CSV-like string
         
     Returns:
-        Operation result with success status, message, and filepath
+        Operation result with success status, message, filepath, and queued=True
     """
+    # Parse the content as JSON data
     try:
-        # Parse the content as JSON data
-        try:
-            data = json.loads(content)
-        except json.JSONDecodeError:
-            # If not valid JSON, treat as CSV
-            data = [line.split(',') for line in content.strip().split('\n')]
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(data)
-        
-        # Ensure the directory exists
-        os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
-        
-        # Save to Excel
-        df.to_excel(filepath, index=False)
+        df = pd.DataFrame(json.loads(content))
+    except json.JSONDecodeError:
+        # If not valid JSON, treat as CSV. Later rows may have more fields than
+        # the first, so size the columns to the widest row up front
+        text = content.strip()
+        width = max((len(row) for row in csv.reader(StringIO(text))), default=0)
         
-        logger.info(f"Created Excel file: {filepath}")
-        return {
-            "success": True,
-            "message": "Successfully created Excel file",
-            "filepath": filepath
-        }
-    except Exception as e:
-        logger.error(f"Error creating Excel file: {str(e)}")
-        return {
-            "success": False,
-            "message": f"Error creating Excel file: {str(e)}",
-            "filepath": None
-        }
+        if width:
+            # Only empty fields become blank cells; text such as "NA" or "null"
+            # is kept as written
+            df = pd.read_csv(StringIO(text), header=None, names=range(width), keep_default_na=False)
+        else:
+            # read_csv rejects input with no columns; write an empty sheet
+            df = pd.DataFrame()
+    
+    # Ensure the directory exists
+    _ensure_dir(filepath)
+    
+    # Save to Excel
+    _queue_save(_dataframes_to_workbook([df]), filepath)
+    
+    logger.info("Created Excel file: %s", filepath)
+    return {
+        "message": "Created Excel file; writing it to disk",
+        "queued": True,
+        "filepath": filepath
+    }
 
 @server.tool()
+@_tool_result("editing Excel file")
 def edit_excel_file(filepath: str, operations: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Edit an existing Excel file using the specified operations.
     
+    The file is written to disk in the background after this returns; call
+    flush_pending_writes to wait for it and to see any error from the write.
+    
     Args:
         filepath: Path to the Excel file
         operations: List of operations to perform, where each operation is a dictionary with:
@@ -300,131 +626,479 @@ def edit_excel_file(filepath: str, operations: List[Dict[str, Any]]) -> Dict[str
             - Additional parameters depending on the operation type
             
     Returns:
-        Operation result with success status, message, and filepath
+        Operation result with success status, message, filepath, and queued=True
     """
-    try:
-        # Check if file exists
-        if not os.path.exists(filepath):
-            return {
-                "success": False,
-                "message": f"File not found: {filepath}",
-                "filepath": None
-            }
+    # Let any queued save of this file finish first
+    _wait_for_writes(filepath)
+    
+    # Check if file exists
+    if not os.path.exists(filepath):
+        raise ToolError(f"File not found: {filepath}")
+    
+    # Load the Excel file
+    wb = openpyxl.load_workbook(filepath)
+    
+    # Apply operations
+    for op in operations:
+        op_type = op.get("type")
+        sheet_name = op.get("sheet", wb.sheetnames[0])
         
-        # Load the Excel file
-        wb = openpyxl.load_workbook(filepath)
+        # Get the sheet, create if it doesn't exist
+        if sheet_name not in wb.sheetnames:
+            wb.create_sheet(sheet_name)
         
-        # Apply operations
-        for op in operations:
-            op_type = op.get("type")
-            sheet_name = op.get("sheet", wb.sheetnames[0])
-            
-            # Get the sheet, create if it doesn't exist
-            if sheet_name not in wb.sheetnames:
-                wb.create_sheet(sheet_name)
-            
-            sheet = wb[sheet_name]
-            
-            if op_type == "update_cell":
-                row = op.get("row", 1)
-                col = op.get("col", 1)
-                value = op.get("value", "")
-                
-                sheet.cell(row=row, column=col, value=value)
-            
-            elif op_type == "update_range":
-                start_row = op.get("start_row", 1)
-                start_col = op.get("start_col", 1)
-                values = op.get("values", [])
-                
-                for i, row_values in enumerate(values):
-                    for j, value in enumerate(row_values):
-                        sheet.cell(row=start_row + i, column=start_col + j, value=value)
-            
-            elif op_type == "delete_row":
-                row = op.get("row", 1)
-                sheet.delete_rows(row)
-            
-            elif op_type == "delete_column":
-                col = op.get("col", 1)
-                sheet.delete_cols(col)
+        sheet = wb[sheet_name]
+        
+        if op_type == "update_cell":
+            row = op.get("row", 1)
+            col = op.get("col", 1)
+            value = op.get("value", "")
             
-            elif op_type == "add_sheet":
-                new_sheet_name = op.get("name", "NewSheet")
-                if new_sheet_name not in wb.sheetnames:
-                    wb.create_sheet(new_sheet_name)
+            sheet.cell(row=row, column=col, value=value)
+        
+        elif op_type == "update_range":
+            start_row = op.get("start_row", 1)
+            start_col = op.get("start_col", 1)
+            values = op.get("values", [])
+            width = max((len(row_values) for row_values in values), default=0)
             
-            elif op_type == "delete_sheet":
-                if sheet_name in wb.sheetnames and len(wb.sheetnames) > 1:
-                    del wb[sheet_name]
+            # iter_rows silently treats 0 as 1, which would shift the whole block
+            if start_row < 1 or start_col < 1:
+                raise ToolError("Row or column values must be at least 1")
             
-            else:
-                logger.warning(f"Unknown operation type: {op_type}")
+            # Walk the target block once instead of resolving each cell by coordinate
+            if width:
+                target_rows = sheet.iter_rows(
+                    min_row=start_row,
+                    max_row=start_row + len(values) - 1,
+                    min_col=start_col,
+                    max_col=start_col + width - 1
+                )
+                for row_cells, row_values in zip(target_rows, values):
+                    for cell, value in zip(row_cells, row_values):
+                        cell.value = value
         
-        # Save the workbook
-        wb.save(filepath)
+        elif op_type == "delete_row":
+            row = op.get("row", 1)
+            sheet.delete_rows(row)
         
-        logger.info(f"Edited Excel file: {filepath}")
-        return {
-            "success": True,
-            "message": "Successfully edited Excel file",
-            "filepath": filepath
-        }
-    except Exception as e:
-        logger.error(f"Error editing Excel file: {str(e)}")
-        return {
-            "success": False,
-            "message": f"Error editing Excel file: {str(e)}",
-            "filepath": None
-        }
+        elif op_type == "delete_column":
+            col = op.get("col", 1)
+            sheet.delete_cols(col)
+        
+        elif op_type == "add_sheet":
+            new_sheet_name = op.get("name", "NewSheet")
+            if new_sheet_name not in wb.sheetnames:
+                wb.create_sheet(new_sheet_name)
+        
+        elif op_type == "delete_sheet":
+            if sheet_name in wb.sheetnames and len(wb.sheetnames) > 1:
+                del wb[sheet_name]
+        
+        else:
+            logger.warning("Unknown operation type: %s", op_type)
+    
+    # Save the workbook
+    _queue_save(wb, filepath)
+    
+    logger.info("Edited Excel file: %s", filepath)
+    return {
+        "message": "Edited Excel file; writing it to disk",
+        "queued": True,
+        "filepath": filepath
+    }
 
 @server.tool()
-def convert_csv_to_excel(source_path: str, target_path: str) -> Dict[str, Any]:
+@_in_thread
+@_tool_result("converting CSV to Excel")
+def convert_csv_to_excel(
+    source_path: str,
+    target_path: str,
+    dtypes: Optional[Dict[str, str]] = None,
+    parse_dates: Optional[List[str]] = None,
+    infer_types: bool = True,
+    compresslevel: int = 1
+) -> Dict[str, Any]:
     """
     Convert a CSV file to an Excel file.
     
+    When the column types are known, pass them in dtypes: pandas then skips
+    type inference, which is a large share of the parse time on big files.
+    When every value can stay text, set infer_types to False to copy the rows
+    across without pandas at all, which is the fastest option.
+    
     Args:
         source_path: Path to the CSV file
         target_path: Path where to save the Excel file
+        dtypes: Optional mapping of column names to pandas dtypes (e.g. {"id": "int64", "name": "str"})
+        parse_dates: Optional list of column names to parse as dates
+        infer_types: Convert numeric and other typed values instead of writing every cell as text;
+            ignored when dtypes or parse_dates is given
+        compresslevel: Zip compression level for the .xlsx file, from 0 (none) to 9 (smallest);
+            higher levels make the file smaller but take longer to write
         
     Returns:
         Operation result with success status, message, and filepath
     """
+    if not 0 <= compresslevel <= 9:
+        raise ToolError(f"compresslevel must be between 0 and 9, got {compresslevel}")
+    
+    # Open the source up front rather than checking for it first, so a missing
+    # file costs no extra stat and cannot vanish between check and read
     try:
-        # Check if source file exists
-        if not os.path.exists(source_path):
-            return {
-                "success": False,
-                "message": f"Source file not found: {source_path}",
-                "filepath": None
-            }
+        file = open(source_path, newline="", encoding="utf-8-sig")
+    except FileNotFoundError:
+        raise ToolError(f"Source file not found: {source_path}") from None
+    
+    with file:
+        # Ensure the directory exists
+        _ensure_dir(target_path)
         
-        # Read the CSV file
-        df = pd.read_csv(source_path)
+        # Don't let an older queued save overwrite this file afterwards
+        _wait_for_writes(target_path)
         
-        # Ensure the directory exists
-        os.makedirs(os.path.dirname(os.path.abspath(target_path)), exist_ok=True)
+        _advise_sequential(file)
         
-        # Save to Excel
-        df.to_excel(target_path, index=False)
+        if not infer_types and dtypes is None and parse_dates is None:
+            # Pass-through: stream rows straight from the csv module, skipping
+            # DataFrame construction entirely
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet("Sheet1")
+            
+            rows = csv.reader(file)
+            for row in rows:
+                if row:  # Skip blank lines, as pandas does
+                    ws.append(_header_row(ws, row))
+                    break
+            for row in rows:
+                if row:
+                    ws.append([value if value != "" else None for value in row])
+        else:
+            # Stream the CSV into a write-only workbook chunk by chunk, so memory
+            # stays bounded by the chunk size rather than the file size
+            wb = _dataframes_to_workbook(_read_csv_chunks(file, dtypes, parse_dates))
+    
+    # Save to Excel
+    _save_workbook(wb, target_path, compresslevel)
+    
+    logger.info("Converted CSV to Excel: %s -> %s", source_path, target_path)
+    return {
+        "message": "Successfully converted CSV to Excel",
+        "filepath": target_path
+    }
+
+@server.tool()
+@_in_thread
+@_tool_result("converting Excel to CSV")
+def convert_excel_to_csv(
+    source_path: str,
+    target_path: str,
+    sheet: Optional[str] = None,
+    chunk_rows: int = 50_000
+) -> Dict[str, Any]:
+    """
+    Convert a worksheet of an Excel file to a CSV file.
+    
+    The workbook is read in streaming mode, so large files are converted
+    without loading the whole sheet into memory.
+    
+    Args:
+        source_path: Path to the Excel file
+        target_path: Path where to save the CSV file
+        sheet: Name of the sheet to convert (defaults to the active sheet)
+        chunk_rows: Number of rows written to the CSV file at a time
         
-        logger.info(f"Converted CSV to Excel: {source_path} -> {target_path}")
-        return {
-            "success": True,
-            "message": "Successfully converted CSV to Excel",
-            "filepath": target_path
-        }
-    except Exception as e:
-        logger.error(f"Error converting CSV to Excel: {str(e)}")
-        return {
-            "success": False,
-            "message": f"Error converting CSV to Excel: {str(e)}",
-            "filepath": None
-        }
+    Returns:
+        Operation result with success status, message, and filepath
+    """
+    # Let any queued save of the source workbook finish first
+    _wait_for_writes(source_path)
+    
+    # Check if source file exists
+    if not os.path.exists(source_path):
+        raise ToolError(f"Source file not found: {source_path}")
+    
+    # Ensure the directory exists
+    _ensure_dir(target_path)
+    
+    # Read-only mode parses the sheet lazily instead of building every cell
+    wb = openpyxl.load_workbook(source_path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet] if sheet is not None else wb.active
+        rows = ws.iter_rows(values_only=True)
+        
+        with _retry_in_missing_dir(
+            target_path, lambda: open(target_path, "w", newline="", encoding="utf-8")
+        ) as file:
+            writer = csv.writer(file)
+            while True:
+                chunk = list(islice(rows, max(chunk_rows, 1)))
+                if not chunk:
+                    break
+                writer.writerows(chunk)
+    finally:
+        wb.close()
+    
+    logger.info("Converted Excel to CSV: %s -> %s", source_path, target_path)
+    return {
+        "message": "Successfully converted Excel to CSV",
+        "filepath": target_path
+    }
 
 # ---- PDF Operations ----
 
+# Page geometry and text settings for create_pdf_file, computed once at import
+_PAGE_HEIGHT = letter[1]
+_PAGE_MARGIN = 40
+_LINE_HEIGHT = 15
+_FONT_NAME = "Helvetica"
+_FONT_SIZE = 12
+
+_PDF_STYLES = getSampleStyleSheet()
+
+# Word paragraph styles that have a direct reportlab counterpart
+_PDF_STYLE_MAP = {
+    "Title": "Title",
+    **{f"Heading {level}": f"Heading{level}" for level in range(1, 7)},
+}
+
+# Body content the reportlab renderer cannot reproduce: images and embedded
+# objects, content controls, merged table cells, list numbering, headers or
+# footers, footnotes and endnotes, and hidden or highlighted text
+_NATIVE_PDF_UNSUPPORTED = (
+    ".//w:drawing | .//w:pict | .//w:object | .//w:sdt"
+    " | .//w:gridSpan | .//w:vMerge"
+    " | .//w:numPr[w:numId[@w:val != '0']]"
+    " | .//w:sectPr/w:headerReference | .//w:sectPr/w:footerReference"
+    " | .//w:footnoteReference | .//w:endnoteReference"
+    " | .//w:r/w:rPr/w:vanish | .//w:r/w:rPr/w:highlight"
+)
+
+# Run properties rendered as reportlab inline tags, in nesting order
+_PDF_RUN_TAGS = (
+    ("bold", "b"),
+    ("italic", "i"),
+    ("underline", "u"),
+    ("strike", "strike"),
+    ("superscript", "super"),
+    ("subscript", "sub"),
+)
+
+# Let explicitly sized runs open up the line spacing instead of overlapping
+for _style_name in {"Normal", *_PDF_STYLE_MAP.values()}:
+    _PDF_STYLES[_style_name].autoLeading = "max"
+
+def _docx_supports_native_pdf(doc: docx.document.Document) -> bool:
+    """Return False if the document uses content the reportlab renderer cannot reproduce."""
+    body = doc.element.body
+    if body.xpath(_NATIVE_PDF_UNSUPPORTED):
+        return False
+    
+    # List numbering can also come from a paragraph style, e.g. "List Bullet"
+    styles = doc.styles.element
+    for style_id in set(body.xpath(".//w:pStyle/@w:val")):
+        style = styles.get_by_id(style_id)
+        while style is not None:
+            if style.xpath("./w:pPr/w:numPr/w:numId[@w:val != '0']"):
+                return False
+            style = styles.get_by_id(style.basedOn_val) if style.basedOn_val else None
+    
+    # Every page is laid out with the first section's size
+    return len({(section.page_width, section.page_height) for section in doc.sections}) == 1
+
+def _run_markup(run: DocxRun) -> tuple:
+    """Return the reportlab opening and closing tags for a run's character formatting."""
+    font = run.font
+    style_font = run.style.font if run.style is not None else None
+    
+    tags = []
+    for attr, tag in _PDF_RUN_TAGS:
+        value = getattr(font, attr)
+        if value is None and style_font is not None:
+            value = getattr(style_font, attr)  # Inherited from a character style, e.g. "Strong"
+        if value:
+            tags.append(tag)
+    
+    attrs = []
+    if font.size is not None:
+        attrs.append(f'size="{font.size.pt:g}"')
+    if font.color.rgb is not None:
+        attrs.append(f'color="#{font.color.rgb}"')
+    if attrs:
+        tags.insert(0, "font " + " ".join(attrs))
+    
+    opening = "".join(f"<{tag}>" for tag in tags)
+    closing = "".join(f"</{tag.split()[0]}>" for tag in reversed(tags))
+    return opening, closing
+
+def _paragraph_segments(paragraph: DocxParagraph) -> List[tuple]:
+    """
+    Return a Word paragraph as reportlab markup, split at explicit page breaks.
+    
+    Each segment is a (markup, has_text) pair; line breaks become <br/> and
+    run formatting the renderer supports becomes inline tags.
+    """
+    segments = [([], False)]
+    
+    for r in paragraph._p.xpath(".//w:r"):
+        opening, closing = _run_markup(DocxRun(r, paragraph))
+        text = []
+        
+        def close_run() -> None:
+            if text:
+                parts, has_text = segments[-1]
+                segments[-1] = (parts + [opening + "".join(text) + closing], has_text)
+                text.clear()
+        
+        for item in r.iterchildren():
+            if item.tag == qn("w:t"):
+                text.append(escape(item.text or ""))
+                if (item.text or "").strip():
+                    segments[-1] = (segments[-1][0], True)
+            elif item.tag == qn("w:tab"):
+                text.append(" ")
+            elif item.tag in (qn("w:br"), qn("w:cr")):
+                if item.get(qn("w:type")) == "page":
+                    close_run()
+                    segments.append(([], False))
+                else:
+                    text.append("<br/>")
+        close_run()
+    
+    return [("".join(parts), has_text) for parts, has_text in segments]
+
+def _docx_to_pdf_native(doc: docx.document.Document, target: Any) -> None:
+    """
+    Render the paragraphs and tables of a Word document to PDF with reportlab.
+    
+    Body content is emitted in document order, on the page size and margins of
+    the first section. Paragraph styles are mapped to the closest reportlab
+    sample style. Bold, italic, underline, strikethrough, superscript,
+    subscript, font size and colour are kept per run, and explicit page breaks
+    start a new page.
+    """
+    story = []
+    for child in doc.element.body.iterchildren():
+        if child.tag == qn("w:p"):
+            paragraph = DocxParagraph(child, doc)
+            style_name = paragraph.style.name if paragraph.style is not None else None
+            style = _PDF_STYLES[_PDF_STYLE_MAP.get(style_name, "Normal")]
+            
+            if story and paragraph.paragraph_format.page_break_before:
+                story.append(platypus.PageBreak())
+            
+            segments = _paragraph_segments(paragraph)
+            for i, (markup, has_text) in enumerate(segments):
+                if i:
+                    story.append(platypus.PageBreak())
+                if has_text:
+                    story.append(platypus.Paragraph(markup, style))
+                elif len(segments) == 1:
+                    story.append(platypus.Spacer(1, style.leading))
+        
+        elif child.tag == qn("w:tbl"):
+            table = DocxTable(child, doc)
+            data = [
+                [
+                    platypus.Paragraph(
+                        "<br/>".join(
+                            markup
+                            for paragraph in cell.paragraphs
+                            for markup, _ in _paragraph_segments(paragraph)
+                        ),
+                        _PDF_STYLES["Normal"]
+                    )
+                    for cell in row.cells
+                ]
+                for row in table.rows
+            ]
+            if data:
+                # splitInRow lets a row taller than a page continue on the next one
+                story.append(platypus.Table(data, splitInRow=1, style=platypus.TableStyle([
+                    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                ])))
+    
+    section = doc.sections[0]
+    pagesize = letter
+    if section.page_width is not None and section.page_height is not None:
+        pagesize = (section.page_width.pt, section.page_height.pt)
+    margins = {
+        name: getattr(section, attr).pt
+        for name, attr in (
+            ("leftMargin", "left_margin"),
+            ("rightMargin", "right_margin"),
+            ("topMargin", "top_margin"),
+            ("bottomMargin", "bottom_margin"),
+        )
+        if getattr(section, attr) is not None
+    }
+    
+    platypus.SimpleDocTemplate(target, pagesize=pagesize, **margins).build(story)
+
+def _convert_word_to_pdf_native(source_path: str, target_path: str) -> bool:
+    """
+    Convert a Word document to PDF with reportlab if it can be done faithfully.
+    
+    Returns False, leaving the conversion to docx2pdf, when python-docx cannot
+    open the file (e.g. .doc or .docm), the document uses content the renderer
+    cannot reproduce, or reportlab fails to lay it out (e.g. a table row taller
+    than a page). A missing source raises FileNotFoundError.
+    """
+    # Document() checks for a path itself before opening it; handing it an
+    # open file instead lets a missing source surface from the one open()
+    try:
+        with open(source_path, "rb") as file:
+            doc = Document(file)
+    except FileNotFoundError:
+        raise
+    except Exception as e:
+        logger.info("python-docx cannot open %s (%s), using docx2pdf", source_path, e)
+        return False
+    
+    if not _docx_supports_native_pdf(doc):
+        logger.info("Document has content the native renderer cannot reproduce, using docx2pdf: %s", source_path)
+        return False
+    
+    _ensure_dir(target_path)
+    try:
+        with _retry_in_missing_dir(target_path, lambda: open(target_path, "wb")) as file:
+            _docx_to_pdf_native(doc, file)
+    except Exception as e:
+        logger.info("Native rendering of %s failed (%s), using docx2pdf", source_path, e)
+        return False
+    
+    return True
+
+def _docx2pdf_convert(source: str, target: str) -> None:
+    """
+    Run docx2pdf.convert, initialising COM for the calling thread on Windows.
+    
+    Tools run in worker threads, and docx2pdf dispatches Word.Application
+    without calling CoInitialize, which COM requires on every thread that
+    uses it.
+    """
+    # docx2pdf asserts on any other file name, which would surface as an empty error
+    if not os.path.isdir(source) and not source.endswith(".docx"):
+        raise ToolError(f"docx2pdf can only convert .docx files, not: {source}")
+    
+    # Word's errors don't tell a missing output directory apart, and launching
+    # it dwarfs a directory check, so bypass _make_dir's memo here
+    _make_dir.__wrapped__(target if os.path.isdir(source) else os.path.dirname(os.path.abspath(target)))
+    
+    if sys.platform != "win32":
+        docx2pdf.convert(source, target)
+        return
+    
+    pythoncom.CoInitialize()
+    try:
+        docx2pdf.convert(source, target)
+    finally:
+        pythoncom.CoUninitialize()
+
 @server.tool()
+@_in_thread
+@_tool_result("creating PDF file")
 def create_pdf_file(filepath: str, content: str) -> Dict[str, Any]:
     """
     Create a new PDF file with the provided text content.
@@ -436,85 +1110,409 @@ def create_pdf_file(filepath: str, content: str) -> Dict[str, Any]:
     Returns:
         Operation result with success status, message, and filepath
     """
-    try:
-        # Ensure the directory exists
-        os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
-        
-        # Create a new PDF with ReportLab
-        c = canvas.Canvas(filepath, pagesize=letter)
-        width, height = letter
+    # Ensure the directory exists
+    _ensure_dir(filepath)
+    
+    with _retry_in_missing_dir(filepath, lambda: open(filepath, "wb")) as file:
+        # Create a new PDF with ReportLab. The file is opened first because a
+        # canvas can only attempt its save once
+        c = canvas.Canvas(file, pagesize=letter)
         
         # Process text content
         lines = content.split('\n')
         
-        y_position = height - 40  # Start position from top
+        # One text object per page, so the font is selected once per page
+        # instead of once per line
+        text = c.beginText(_PAGE_MARGIN, _PAGE_HEIGHT - _PAGE_MARGIN)  # Start position from top
+        text.setFont(_FONT_NAME, _FONT_SIZE, leading=_LINE_HEIGHT)
         for line in lines:
-            if y_position < 40:  # If we're at the bottom of the page
+            if text.getY() < _PAGE_MARGIN:  # If we're at the bottom of the page
+                c.drawText(text)
                 c.showPage()  # Create a new page
-                y_position = height - 40  # Reset position
+                text = c.beginText(_PAGE_MARGIN, _PAGE_HEIGHT - _PAGE_MARGIN)  # Reset position
+                text.setFont(_FONT_NAME, _FONT_SIZE, leading=_LINE_HEIGHT)
             
-            c.drawString(40, y_position, line)
-            y_position -= 15  # Move down for next line
+            text.textLine(line)  # Moves down for next line
         
+        c.drawText(text)
         c.save()
-        
-        logger.info(f"Created PDF file: {filepath}")
-        return {
-            "success": True,
-            "message": "Successfully created PDF file",
-            "filepath": filepath
-        }
-    except Exception as e:
-        logger.error(f"Error creating PDF file: {str(e)}")
-        return {
-            "success": False,
-            "message": f"Error creating PDF file: {str(e)}",
-            "filepath": None
-        }
+    
+    logger.info("Created PDF file: %s", filepath)
+    return {
+        "message": "Successfully created PDF file",
+        "filepath": filepath
+    }
 
 @server.tool()
-def convert_word_to_pdf(source_path: str, target_path: str) -> Dict[str, Any]:
+@_in_thread
+@_tool_result("converting Word to PDF")
+def convert_word_to_pdf(source_path: str, target_path: str, use_native_pdf: bool = True) -> Dict[str, Any]:
     """
     Convert a Microsoft Word document to a PDF file.
     
     Args:
         source_path: Path to the Word document
         target_path: Path where to save the PDF file
+        use_native_pdf: Render text and tables directly with reportlab instead of
+            automating Microsoft Word. Documents with images, embedded objects,
+            content controls, merged cells, lists, headers or footers, footnotes,
+            hidden or highlighted text, or mixed page sizes always go through
+            docx2pdf, as do files reportlab cannot open or lay out.
         
     Returns:
         Operation result with success status, message, and filepath
     """
-    try:
-        # Check if source file exists
-        if not os.path.exists(source_path):
+    # Let any queued save of the source document finish first
+    _wait_for_writes(source_path)
+    
+    if use_native_pdf:
+        try:
+            native = _convert_word_to_pdf_native(source_path, target_path)
+        except FileNotFoundError:
+            raise ToolError(f"Source file not found: {source_path}") from None
+        
+        if native:
+            logger.info("Converted Word to PDF natively: %s -> %s", source_path, target_path)
             return {
-                "success": False,
-                "message": f"Source file not found: {source_path}",
-                "filepath": None
+                "message": "Successfully converted Word to PDF",
+                "filepath": target_path
             }
+    elif not os.path.exists(source_path):
+        # docx2pdf reports a missing source differently on each platform
+        raise ToolError(f"Source file not found: {source_path}")
+    
+    # Ensure the directory exists
+    _ensure_dir(target_path)
+    
+    # Convert Word to PDF using docx2pdf
+    _docx2pdf_convert(source_path, target_path)
+    
+    logger.info("Converted Word to PDF: %s -> %s", source_path, target_path)
+    return {
+        "message": "Successfully converted Word to PDF",
+        "filepath": target_path
+    }
+
+@server.tool()
+@_in_thread
+@_tool_result("converting Word documents to PDF")
+def convert_word_to_pdf_batch(source_dir: str, target_dir: str, use_native_pdf: bool = True) -> Dict[str, Any]:
+    """
+    Convert every Word document (.docx) in a directory to PDF files.
+    
+    Documents that need Microsoft Word are converted together in a single
+    docx2pdf directory run, so Word is launched once for the whole batch
+    instead of once per file.
+    
+    Args:
+        source_dir: Directory containing the Word documents
+        target_dir: Directory where to save the PDF files
+        use_native_pdf: Render text and tables directly with reportlab where possible
         
-        # Ensure the directory exists
-        os.makedirs(os.path.dirname(os.path.abspath(target_path)), exist_ok=True)
+    Returns:
+        Operation result with success status, message, target directory,
+        the converted PDF paths, and a mapping of failed sources to errors
+    """
+    # Let any queued document saves finish first
+    _wait_for_writes()
+    
+    # A single directory read both checks the source directory and lists it,
+    # skipping Word lock files (~$name.docx) and anything that is not a file
+    try:
+        with os.scandir(source_dir) as entries:
+            sources = sorted(
+                entry.path for entry in entries
+                if entry.name.endswith(".docx") and not entry.name.startswith("~$") and entry.is_file()
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        raise ToolError(f"Source directory not found: {source_dir}") from None
+    
+    # Ensure the directory exists
+    _make_dir(os.path.abspath(target_dir))
+    
+    def pdf_path(source_path: str) -> str:
+        return os.path.join(target_dir, Path(source_path).stem + ".pdf")
+    
+    def pdf_mtime(source_path: str) -> Optional[int]:
+        try:
+            return os.stat(pdf_path(source_path)).st_mtime_ns
+        except FileNotFoundError:
+            return None
+    
+    converted = []
+    failed = {}
+    needs_word = []
+    
+    for source_path in sources:
+        if not use_native_pdf:
+            needs_word.append(source_path)
+            continue
+        
+        try:
+            if _convert_word_to_pdf_native(source_path, pdf_path(source_path)):
+                converted.append(pdf_path(source_path))
+            else:
+                needs_word.append(source_path)
+        except Exception as e:
+            failed[source_path] = str(e)
+    
+    if needs_word:
+        # A PDF left in target_dir by an earlier run must not count as output
+        previous_mtimes = {source_path: pdf_mtime(source_path) for source_path in needs_word}
+        
+        error = "docx2pdf did not produce a PDF file"
+        try:
+            # docx2pdf's directory mode takes every *.docx it finds, so stage
+            # exactly the documents that need Word and convert them in one run
+            with tempfile.TemporaryDirectory() as staging_dir:
+                for source_path in needs_word:
+                    shutil.copy2(source_path, staging_dir)
+                _docx2pdf_convert(staging_dir, target_dir)
+        except Exception as e:
+            # docx2pdf stops at the first failure; the PDFs Word wrote before it
+            # are still checked below, along with the native conversions
+            logger.error("Error converting Word documents with docx2pdf: %s", e)
+            error = str(e) or type(e).__name__
+        
+        for source_path in needs_word:
+            mtime = pdf_mtime(source_path)
+            if mtime is not None and mtime != previous_mtimes[source_path]:
+                converted.append(pdf_path(source_path))
+            else:
+                failed[source_path] = error
+    
+    logger.info("Converted %d of %d Word documents to PDF: %s -> %s", len(converted), len(sources), source_dir, target_dir)
+    return {
+        "success": not failed,
+        "message": f"Converted {len(converted)} of {len(sources)} Word documents to PDF",
+        "filepath": target_dir,
+        "converted": converted,
+        "failed": failed
+    }
+
+# A single headless LibreOffice process is started on first use and kept alive,
+# so each conversion only pays for a UNO call instead of an application launch
+_SOFFICE_PORT = 2002
+_SOFFICE_STARTUP_TIMEOUT = 20
+_soffice_lock = threading.Lock()
+_soffice_process: Optional[subprocess.Popen] = None
+_soffice_desktop: Any = None
+_soffice_profile_dir: Optional[str] = None
+
+def _soffice_binary() -> Optional[str]:
+    """Return the LibreOffice executable, or None if LibreOffice or its UNO bridge is unavailable."""
+    if uno is None:
+        return None
+    return shutil.which("soffice") or shutil.which("libreoffice")
+
+def _uno_properties(**values: Any) -> tuple:
+    """Build the PropertyValue tuple UNO calls take as keyword arguments."""
+    return tuple(PropertyValue(Name=name, Value=value) for name, value in values.items())
+
+def _get_soffice_desktop() -> Any:
+    """Return the Desktop of the persistent LibreOffice process, starting it if needed."""
+    global _soffice_process, _soffice_desktop, _soffice_profile_dir
+    
+    if _soffice_desktop is not None:
+        return _soffice_desktop
+    
+    if _soffice_process is None or _soffice_process.poll() is not None:
+        # A private profile keeps a LibreOffice the user already has open from
+        # taking over the launch (soffice hands off to it and exits at once)
+        if _soffice_profile_dir is None:
+            _soffice_profile_dir = tempfile.mkdtemp(prefix="document-mcp-soffice-")
+        
+        _soffice_process = subprocess.Popen(
+            [
+                _soffice_binary(),
+                f"-env:UserInstallation={Path(_soffice_profile_dir).as_uri()}",
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--norestore",
+                f"--accept=socket,host=localhost,port={_SOFFICE_PORT};urp;"
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+    
+    local_context = uno.getComponentContext()
+    resolver = local_context.ServiceManager.createInstanceWithContext(
+        "com.sun.star.bridge.UnoUrlResolver", local_context
+    )
+    
+    # The process accepts connections only once it has finished starting up
+    deadline = time.monotonic() + _SOFFICE_STARTUP_TIMEOUT
+    while True:
+        try:
+            context = resolver.resolve(
+                f"uno:socket,host=localhost,port={_SOFFICE_PORT};urp;StarOffice.ComponentContext"
+            )
+            break
+        except NoConnectException:
+            # e.g. a broken profile, or another process holding the port
+            if _soffice_process.poll() is not None:
+                raise RuntimeError(
+                    f"LibreOffice exited during startup with code {_soffice_process.returncode}"
+                )
+            if time.monotonic() > deadline:
+                raise RuntimeError("Timed out waiting for LibreOffice to start")
+            time.sleep(0.2)
+    
+    _soffice_desktop = context.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", context)
+    return _soffice_desktop
+
+def _convert_with_soffice(source_path: str, target_path: str) -> None:
+    """Convert a Word document to PDF through the persistent LibreOffice process."""
+    global _soffice_desktop
+    
+    # As with docx2pdf, bypass _make_dir's memo in case the directory was removed
+    _make_dir.__wrapped__(os.path.dirname(os.path.abspath(target_path)))
+    
+    with _soffice_lock:
+        try:
+            desktop = _get_soffice_desktop()
+            doc = desktop.loadComponentFromURL(
+                uno.systemPathToFileUrl(os.path.abspath(source_path)), "_blank", 0, _uno_properties(Hidden=True)
+            )
+            if doc is None:
+                raise ToolError(f"LibreOffice could not open: {source_path}")
+            try:
+                doc.storeToURL(
+                    uno.systemPathToFileUrl(os.path.abspath(target_path)),
+                    _uno_properties(FilterName="writer_pdf_Export")
+                )
+            finally:
+                doc.close(True)
+        except ToolError:
+            raise  # The bridge is fine; only this document failed
+        except Exception:
+            # The bridge may have died with the process; reconnect on the next call
+            _soffice_desktop = None
+            raise
+
+def _stop_soffice() -> None:
+    """Shut down the persistent LibreOffice process, if one was started, and remove its profile."""
+    if _soffice_process is not None and _soffice_process.poll() is None:
+        _soffice_process.terminate()
+        try:
+            _soffice_process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+    if _soffice_profile_dir is not None:
+        shutil.rmtree(_soffice_profile_dir, ignore_errors=True)
+
+atexit.register(_stop_soffice)
+
+@server.tool()
+@_in_thread
+@_tool_result("converting Word to PDF")
+def convert_word_to_pdf_soffice(source_path: str, target_path: str) -> Dict[str, Any]:
+    """
+    Convert a Microsoft Word document to a PDF file using headless LibreOffice.
+    
+    LibreOffice is started once and reused for later conversions, and works on
+    Linux as well. Falls back to docx2pdf when LibreOffice or its Python UNO
+    bridge is not available.
+    
+    Args:
+        source_path: Path to the Word document
+        target_path: Path where to save the PDF file
         
-        # Convert Word to PDF using docx2pdf
-        docx2pdf.convert(source_path, target_path)
+    Returns:
+        Operation result with success status, message, and filepath
+    """
+    # Let any queued save of the source document finish first
+    _wait_for_writes(source_path)
+    
+    # Check if source file exists
+    if not os.path.exists(source_path):
+        raise ToolError(f"Source file not found: {source_path}")
+    
+    # Ensure the directory exists
+    _ensure_dir(target_path)
+    
+    if _soffice_binary() is not None:
+        _convert_with_soffice(source_path, target_path)
         
-        logger.info(f"Converted Word to PDF: {source_path} -> {target_path}")
+        logger.info("Converted Word to PDF with LibreOffice: %s -> %s", source_path, target_path)
         return {
-            "success": True,
             "message": "Successfully converted Word to PDF",
             "filepath": target_path
         }
-    except Exception as e:
-        logger.error(f"Error converting Word to PDF: {str(e)}")
+    
+    logger.info("LibreOffice is not available, using docx2pdf: %s", source_path)
+    _docx2pdf_convert(source_path, target_path)
+    
+    logger.info("Converted Word to PDF: %s -> %s", source_path, target_path)
+    return {
+        "message": "Successfully converted Word to PDF",
+        "filepath": target_path
+    }
+
+# ---- Storage ----
+
+@server.tool()
+@_in_thread
+def flush_pending_writes() -> Dict[str, Any]:
+    """
+    Wait until every queued Word and Excel save has been written to disk.
+    
+    The Word and Excel create and edit tools, and convert_txt_to_word, return
+    queued=True as soon as the document is built in memory; call this before
+    relying on the files being present on disk. A failed write is only
+    reported here.
+    
+    Returns:
+        Operation result with success status, message, and a mapping of
+        filepaths to error messages for writes that failed
+    """
+    _wait_for_writes()
+    
+    with _writes_changed:
+        errors = dict(_write_errors)
+        _write_errors.clear()
+    
+    if errors:
         return {
             "success": False,
-            "message": f"Error converting Word to PDF: {str(e)}",
-            "filepath": None
+            "message": f"Failed to write {len(errors)} file(s)",
+            "errors": errors
         }
+    return {
+        "success": True,
+        "message": "All pending writes are on disk",
+        "errors": {}
+    }
 
 # ---- Resources ----
 
+# Static, so built once at import and shared by every read of the resource
+_CAPABILITIES: Dict[str, Any] = {
+    "name": "Document Operations",
+    "version": "0.1.0",
+    "description": "Model Context Protocol server for document operations (Word, Excel, PDF)",
+    "document_operations": {
+        "word": {
+            "create": True,
+            "edit": True,
+            "convert_from_txt": True
+        },
+        "excel": {
+            "create": True,
+            "edit": True,
+            "convert_from_csv": True,
+            "convert_to_csv": True
+        },
+        "pdf": {
+            "create": True,
+            "convert_from_word": True,
+            "convert_from_word_batch": True,
+            "convert_from_word_libreoffice": True
+        }
+    }
+}
+
 @server.resource("capabilities://")
 def get_capabilities() -> Dict[str, Any]:
     """
@@ -523,54 +1521,32 @@ def get_capabilities() -> Dict[str, Any]:
     Returns:
         Dictionary containing capabilities information
     """
-    return {
-        "name": "Document Operations",
-        "version": "0.1.0",
-        "description": "Model Context Protocol server for document operations (Word, Excel, PDF)",
-        "document_operations": {
-            "word": {
-                "create": True,
-                "edit": True,
-                "convert_from_txt": True
-            },
-            "excel": {
-                "create": True,
-                "edit": True,
-                "convert_from_csv": True
-            },
-            "pdf": {
-                "create": True,
-                "convert_from_word": True
-            }
-        }
-    }
+    return _CAPABILITIES
 
 def main():
     """Main entry point for the server."""
     try:
-        # Setup logging directory
-        log_dir = Path(__file__).parent.parent / "logs"
-        log_dir.mkdir(exist_ok=True)
-        
-        # Log to file instead of stdout
+        # Log to file instead of stdout (the logs directory is created at import)
         startup_logger = logging.getLogger("startup")
         startup_logger.setLevel(logging.INFO)
         
         # Make sure startup logger doesn't also log to console
         startup_logger.propagate = False
         
-        # Add file handler for startup logs
-        startup_log_file = log_dir / "startup.log"
-        file_handler = logging.FileHandler(startup_log_file)
-        file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
-        startup_logger.addHandler(file_handler)
+        # Add file handler for startup logs, reusing it if main() runs again
+        # in the same process (e.g. when the server is embedded)
+        if not startup_logger.handlers:
+            startup_log_file = log_dir / "startup.log"
+            file_handler = logging.FileHandler(startup_log_file)
+            file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+            startup_logger.addHandler(file_handler)
         
         # Log startup information to file only
         startup_logger.info("Starting Document Operations MCP Server...")
-        startup_logger.info(f"Python version: {sys.version}")
-        startup_logger.info(f"Python executable: {sys.executable}")
-        startup_logger.info(f"Working directory: {os.getcwd()}")
-        startup_logger.info(f"Logs directory: {log_dir}")
+        startup_logger.info("Python version: %s", sys.version)
+        startup_logger.info("Python executable: %s", sys.executable)
+        startup_logger.info("Working directory: %s", os.getcwd())
+        startup_logger.info("Logs directory: %s", log_dir)
         
         # Verify environment
         if sys.prefix == sys.base_prefix:
@@ -581,7 +1557,7 @@ def main():
         # Run the server
         server.run()
     except Exception as e:
-        logger.error(f"Error starting server: {str(e)}")
+        logger.error("Error starting server: %s", e)
         import traceback
         logger.error(traceback.format_exc())
         sys.exit(1)